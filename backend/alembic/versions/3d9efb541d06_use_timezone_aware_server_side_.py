@@ -0,0 +1,75 @@
+"""use timezone-aware server-side timestamps
+
+Revision ID: 3d9efb541d06
+Revises: e14579da341d
+Create Date: 2026-10-15 21:30:39.904512
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '3d9efb541d06'
+down_revision: Union[str, Sequence[str], None] = 'e14579da341d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing values were written with datetime.utcnow(), so interpret them as UTC
+    op.alter_column('projects', 'created_at',
+               existing_type=postgresql.TIMESTAMP(),
+               type_=sa.DateTime(timezone=True),
+               existing_nullable=False,
+               server_default=sa.text('now()'),
+               postgresql_using="created_at AT TIME ZONE 'UTC'")
+    op.alter_column('projects', 'updated_at',
+               existing_type=postgresql.TIMESTAMP(),
+               type_=sa.DateTime(timezone=True),
+               existing_nullable=False,
+               server_default=sa.text('now()'),
+               postgresql_using="updated_at AT TIME ZONE 'UTC'")
+    op.alter_column('users', 'created_at',
+               existing_type=postgresql.TIMESTAMP(),
+               type_=sa.DateTime(timezone=True),
+               existing_nullable=False,
+               server_default=sa.text('now()'),
+               postgresql_using="created_at AT TIME ZONE 'UTC'")
+    op.alter_column('users', 'updated_at',
+               existing_type=postgresql.TIMESTAMP(),
+               type_=sa.DateTime(timezone=True),
+               existing_nullable=False,
+               server_default=sa.text('now()'),
+               postgresql_using="updated_at AT TIME ZONE 'UTC'")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column('users', 'updated_at',
+               existing_type=sa.DateTime(timezone=True),
+               type_=postgresql.TIMESTAMP(),
+               existing_nullable=False,
+               server_default=None,
+               postgresql_using="updated_at AT TIME ZONE 'UTC'")
+    op.alter_column('users', 'created_at',
+               existing_type=sa.DateTime(timezone=True),
+               type_=postgresql.TIMESTAMP(),
+               existing_nullable=False,
+               server_default=None,
+               postgresql_using="created_at AT TIME ZONE 'UTC'")
+    op.alter_column('projects', 'updated_at',
+               existing_type=sa.DateTime(timezone=True),
+               type_=postgresql.TIMESTAMP(),
+               existing_nullable=False,
+               server_default=None,
+               postgresql_using="updated_at AT TIME ZONE 'UTC'")
+    op.alter_column('projects', 'created_at',
+               existing_type=sa.DateTime(timezone=True),
+               type_=postgresql.TIMESTAMP(),
+               existing_nullable=False,
+               server_default=None,
+               postgresql_using="created_at AT TIME ZONE 'UTC'")
@@ -1,72 +1,95 @@
 """Authentication API endpoints."""
 
-from typing import Annotated
+from typing import Annotated, Any, Dict
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
 
-from app.core.database import get_db
-from app.core.security import hash_password, verify_password, create_access_token
+from app.core.database import driver_connection
+from app.core.security import (
+    DUMMY_PASSWORD_HASH,
+    hash_password,
+    verify_password,
+    create_access_token,
+)
 from app.models.user import User
 from app.schemas.user import UserCreate, UserResponse, Token
-from app.api.deps import get_current_user
+from app.api.deps import AuthUser, DbSession, get_current_user
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
+_SELECT_EMAIL_EXISTS = "SELECT 1 FROM users WHERE email = $1 LIMIT 1"
+_SELECT_LOGIN_USER = "SELECT id, hashed_password FROM users WHERE email = $1"
+
+# Only turned into an HTTPException when actually raising, as in app.core.security
+_EMAIL_CONFLICT_KWARGS: Dict[str, Any] = {
+    "status_code": status.HTTP_409_CONFLICT,
+    "detail": "Email already registered",
+}
+
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def register(
     user_data: UserCreate,
-    db: Annotated[AsyncSession, Depends(get_db)]
-) -> User:
-    result = await db.execute(
-        select(User).where(User.email == user_data.email)
-    )
-    existing_user = result.scalar_one_or_none()
+    db: DbSession
+) -> UserResponse:
+    async with driver_connection(db) as conn:
+        exists = await conn.fetchval(_SELECT_EMAIL_EXISTS, user_data.email)
+    if exists is not None:
+        raise HTTPException(**_EMAIL_CONFLICT_KWARGS)
 
-    if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="Email already registered"
+    stmt = (
+        insert(User)
+        .values(
+            email=user_data.email,
+            hashed_password=await hash_password(user_data.password),
+            full_name=user_data.full_name,
         )
-
-    new_user = User(
-        email=user_data.email,
-        hashed_password=hash_password(user_data.password),
-        full_name=user_data.full_name
+        .returning(User.id, User.created_at, User.updated_at)
     )
 
-    db.add(new_user)
-    await db.commit()
-    await db.refresh(new_user)
+    try:
+        row = (await db.execute(stmt)).one()
+        await db.commit()
+    except IntegrityError:
+        # The unique index on users.email catches concurrent registrations
+        await db.rollback()
+        raise HTTPException(**_EMAIL_CONFLICT_KWARGS)
 
-    return new_user
+    return UserResponse(
+        id=row.id,
+        email=user_data.email,
+        full_name=user_data.full_name,
+        created_at=row.created_at,
+        updated_at=row.updated_at,
+    )
 
 
 @router.post("/login", response_model=Token)
 async def login(
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
-    db: Annotated[AsyncSession, Depends(get_db)]
+    db: DbSession
 ) -> Token:
-    result = await db.execute(
-        select(User).where(User.email == form_data.username)
-    )
-    user = result.scalar_one_or_none()
+    async with driver_connection(db) as conn:
+        user = await conn.fetchrow(_SELECT_LOGIN_USER, form_data.username)
+
+    stored_hash = user["hashed_password"] if user else DUMMY_PASSWORD_HASH
+    password_ok = await verify_password(form_data.password, stored_hash)
 
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    if not user or not password_ok:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    access_token = create_access_token(data={"sub": str(user.id)})
+    access_token = create_access_token(data={"sub": str(user["id"])})
     return Token(access_token=access_token, token_type="bearer")
 
 
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_info(
-    current_user: Annotated[User, Depends(get_current_user)]
-) -> User:
+    current_user: Annotated[AuthUser, Depends(get_current_user)]
+) -> AuthUser:
     return current_user
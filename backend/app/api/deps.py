@@ -1,43 +1,90 @@
 """API dependencies for dependency injection."""
 
-from typing import Annotated
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Annotated, Any, Dict
 from uuid import UUID
-from fastapi import Depends, HTTPException, status
+
+from cachetools import TTLCache
+from fastapi import Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 
-from app.core.database import get_db
-from app.core.security import oauth2_scheme, decode_access_token
-from app.models.user import User
+from app.core.database import driver_connection, get_db
+from app.core.security import (
+    CREDENTIALS_EXCEPTION_KWARGS,
+    oauth2_scheme,
+    decode_access_token,
+)
 
 
-async def get_current_user(
-    token: Annotated[str, Depends(oauth2_scheme)],
-    db: Annotated[AsyncSession, Depends(get_db)]
-) -> User:
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
+@dataclass(frozen=True, slots=True)
+class AuthUser:
+    """Lightweight, session-independent view of the authenticated user."""
+
+    id: UUID
+    email: str
+    full_name: str | None
+    created_at: datetime
+    updated_at: datetime
+
+
+# One session per request: FastAPI caches dependency results within a request,
+# so get_auth_context and the endpoint share this session and its pooled
+# connection instead of each checking one out.
+DbSession = Annotated[AsyncSession, Depends(get_db, use_cache=True)]
+
+_SELECT_AUTH_USER = (
+    "SELECT id, email, full_name, created_at, updated_at FROM users WHERE id = $1"
+)
+
+# Authenticated users keyed by id, so repeat requests skip the users lookup.
+_user_cache: TTLCache[UUID, AuthUser] = TTLCache(maxsize=5000, ttl=60)
+
+
+def invalidate_cached_user(user_id: UUID) -> None:
+    _user_cache.pop(user_id, None)
 
+
+@dataclass(frozen=True, slots=True)
+class AuthContext:
+    """The authenticated user together with the verified token claims."""
+
+    user: AuthUser
+    claims: Dict[str, Any]
+
+
+async def get_auth_context(
+    token: Annotated[str, Depends(oauth2_scheme)],
+    db: DbSession
+) -> AuthContext:
     payload = decode_access_token(token)
     user_id_str: str | None = payload.get("sub")
 
     if user_id_str is None:
-        raise credentials_exception
+        raise HTTPException(**CREDENTIALS_EXCEPTION_KWARGS)
 
     try:
         user_id = UUID(user_id_str)
     except (ValueError, AttributeError):
-        raise credentials_exception
+        raise HTTPException(**CREDENTIALS_EXCEPTION_KWARGS)
 
-    result = await db.execute(
-        select(User).where(User.id == user_id)
-    )
-    user = result.scalar_one_or_none()
+    user = _user_cache.get(user_id)
+    if user is not None:
+        return AuthContext(user=user, claims=payload)
 
-    if user is None:
-        raise credentials_exception
+    async with driver_connection(db) as conn:
+        row = await conn.fetchrow(_SELECT_AUTH_USER, user_id)
 
-    return user
+    if row is None:
+        raise HTTPException(**CREDENTIALS_EXCEPTION_KWARGS)
+
+    user = AuthUser(*row)
+    _user_cache[user_id] = user
+
+    return AuthContext(user=user, claims=payload)
+
+
+async def get_current_user(
+    auth: Annotated[AuthContext, Depends(get_auth_context, use_cache=True)]
+) -> AuthUser:
+    return auth.user
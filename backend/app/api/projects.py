@@ -1,17 +1,17 @@
 """Projects API endpoints."""
 
+import base64
 import uuid
+from datetime import datetime
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import delete, insert, select, tuple_, update
 
-from app.core.database import get_db
-from app.api.deps import get_current_user
-from app.models.user import User
+from app.api.deps import AuthUser, DbSession, get_current_user
 from app.models.project import Project
-from app.schemas.project import ProjectCreate, ProjectUpdate, ProjectResponse
+from app.schemas.project import ProjectCreate, ProjectUpdate, ProjectResponse, ProjectPage
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
@@ -30,41 +30,94 @@ async def get_project_or_404(
     return project
 
 
-@router.get("", response_model=list[ProjectResponse])
+def _encode_cursor(project: ProjectResponse) -> str:
+    key = f"{project.created_at.isoformat()}|{project.id}"
+    return base64.urlsafe_b64encode(key.encode()).rstrip(b"=").decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    """Decode a list cursor back into the (created_at, id) key it was built from."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at_str, _, project_id = raw.partition("|")
+        created_at = datetime.fromisoformat(created_at_str)
+        if created_at.tzinfo is None:
+            raise ValueError("cursor timestamp has no timezone")
+        return created_at, uuid.UUID(project_id)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor") from None
+
+
+def _project_response(project: Project) -> ProjectResponse:
+    # Rows come straight from the database, so build the schema without re-validating
+    return ProjectResponse.model_construct(
+        id=project.id,
+        user_id=project.user_id,
+        name=project.name,
+        description=project.description,
+        status=project.status,
+        color=project.color,
+        created_at=project.created_at,
+        updated_at=project.updated_at,
+    )
+
+
+@router.get("", response_model=ProjectPage)
 async def list_projects(
-    current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
-) -> list[Project]:
-    result = await db.execute(
-        select(Project).where(Project.user_id == current_user.id)
+    current_user: Annotated[AuthUser, Depends(get_current_user)],
+    db: DbSession,
+    limit: Annotated[int, Query(ge=1, le=200)] = 50,
+    cursor: Annotated[str | None, Query()] = None,
+) -> ProjectPage:
+    stmt = (
+        select(Project)
+        .where(Project.user_id == current_user.id)
+        .order_by(Project.created_at.desc(), Project.id.desc())
+        .limit(limit)
     )
-    return list(result.scalars().all())
+
+    if cursor is not None:
+        # Keyset pagination: the cursor carries the (created_at, id) key of the
+        # last project on the previous page, so paging continues correctly even
+        # if that project has since been deleted, and skipped rows are never scanned
+        created_at, project_id = _decode_cursor(cursor)
+        stmt = stmt.where(tuple_(Project.created_at, Project.id) < (created_at, project_id))
+
+    result = await db.execute(stmt)
+    items = [_project_response(project) for project in result.scalars()]
+    next_cursor = _encode_cursor(items[-1]) if len(items) == limit else None
+    # An already-built ProjectPage passes FastAPI's response_model check as-is
+    return ProjectPage.model_construct(items=items, next_cursor=next_cursor)
 
 
 @router.post("", response_model=ProjectResponse, status_code=status.HTTP_201_CREATED)
 async def create_project(
     project_data: ProjectCreate,
-    current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[AuthUser, Depends(get_current_user)],
+    db: DbSession,
 ) -> Project:
-    project = Project(
-        user_id=current_user.id,
-        name=project_data.name,
-        description=project_data.description,
-        status=project_data.status,
-        color=project_data.color,
+    # RETURNING brings back the server-generated timestamps, so no refresh query
+    result = await db.execute(
+        insert(Project)
+        .values(
+            user_id=current_user.id,
+            name=project_data.name,
+            description=project_data.description,
+            status=project_data.status,
+            color=project_data.color,
+        )
+        .returning(Project)
     )
-    db.add(project)
+    project = result.scalar_one()
     await db.commit()
-    await db.refresh(project)
     return project
 
 
 @router.get("/{project_id}", response_model=ProjectResponse)
 async def get_project(
     project_id: uuid.UUID,
-    current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[AuthUser, Depends(get_current_user)],
+    db: DbSession,
 ) -> Project:
     return await get_project_or_404(project_id, current_user.id, db)
 
@@ -73,26 +126,38 @@ async def get_project(
 async def update_project(
     project_id: uuid.UUID,
     project_data: ProjectUpdate,
-    current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[AuthUser, Depends(get_current_user)],
+    db: DbSession,
 ) -> Project:
-    project = await get_project_or_404(project_id, current_user.id, db)
-
     updates = project_data.model_dump(exclude_unset=True)
-    for field, value in updates.items():
-        setattr(project, field, value)
+    if not updates:
+        return await get_project_or_404(project_id, current_user.id, db)
+
+    # Ownership check, update and reload in one round-trip
+    result = await db.execute(
+        update(Project)
+        .where(Project.id == project_id, Project.user_id == current_user.id)
+        .values(**updates)
+        .returning(Project)
+    )
+    project = result.scalar_one_or_none()
+    if project is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
 
     await db.commit()
-    await db.refresh(project)
     return project
 
 
 @router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_project(
     project_id: uuid.UUID,
-    current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[AuthUser, Depends(get_current_user)],
+    db: DbSession,
 ) -> None:
-    project = await get_project_or_404(project_id, current_user.id, db)
-    await db.delete(project)
+    result = await db.execute(
+        delete(Project).where(Project.id == project_id, Project.user_id == current_user.id)
+    )
+    if result.rowcount == 0:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
+
     await db.commit()
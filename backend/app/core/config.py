@@ -1,5 +1,6 @@
 """Application configuration using Pydantic Settings."""
 
+from functools import lru_cache
 from pathlib import Path
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -9,9 +10,13 @@ BASE_DIR: Path = Path(__file__).resolve().parent.parent.parent
 
 class Settings(BaseSettings):
     DATABASE_URL: str
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_STATEMENT_CACHE_SIZE: int = 1024
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    BCRYPT_ROUNDS: int = 12
     ANTHROPIC_API_KEY: str
     CORS_ORIGINS: list[str] = ["http://localhost:5173"]
     APP_NAME: str = "Orbit"
@@ -26,4 +31,9 @@ class Settings(BaseSettings):
     )
 
 
-settings = Settings()
+@lru_cache
+def get_settings() -> Settings:
+    return Settings()
+
+
+settings = get_settings()
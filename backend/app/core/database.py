@@ -1,8 +1,11 @@
 """Database configuration and session management."""
 
 import logging
-from typing import AsyncGenerator
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, AsyncIterator
 
+from sqlalchemy import event, text
+from sqlalchemy.engine import ExceptionContext
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 
@@ -11,7 +14,7 @@ from app.core.config import settings
 logger = logging.getLogger(__name__)
 
 try:
-    import asyncpg  # noqa: F401
+    import asyncpg
 except ImportError:
     raise ImportError(
         "asyncpg is required for async database operations. "
@@ -19,27 +22,71 @@ except ImportError:
     )
 
 
+_ASYNC_URL_PREFIXES = {
+    "postgresql://": "postgresql+asyncpg://",
+    "postgres://": "postgresql+asyncpg://",
+}
+
+
 def get_async_database_url(sync_url: str) -> str:
     """Convert synchronous PostgreSQL URL to async format."""
-    if sync_url.startswith("postgresql://"):
-        return sync_url.replace("postgresql://", "postgresql+asyncpg://")
-    elif sync_url.startswith("postgres://"):
-        return sync_url.replace("postgres://", "postgresql+asyncpg://")
+    for sync_prefix, async_prefix in _ASYNC_URL_PREFIXES.items():
+        if sync_url.startswith(sync_prefix):
+            return async_prefix + sync_url[len(sync_prefix):]
     return sync_url
 
 
+def get_asyncpg_dsn(url: str) -> str:
+    """Convert a (possibly SQLAlchemy-style) PostgreSQL URL to a plain asyncpg DSN."""
+    return url.replace("postgresql+asyncpg://", "postgresql://", 1)
+
+
 ASYNC_DATABASE_URL = get_async_database_url(settings.DATABASE_URL)
 
+# SQL logging goes through the standard "sqlalchemy.engine" logger rather than
+# echo=, so the engine checks a plain logger level instead of wrapping it in an
+# echo logger, and statement logging can be tuned with ordinary logging config.
+_sql_logger = logging.getLogger("sqlalchemy.engine")
+_sql_logger.setLevel(logging.INFO if settings.DEBUG else logging.WARNING)
+if settings.DEBUG and not _sql_logger.handlers:
+    _sql_logger.addHandler(logging.StreamHandler())
+
+# Behind PgBouncer, pass poolclass=NullPool instead of the pool sizing arguments
+# and let PgBouncer own connection pooling (pre-ping is redundant there too).
+# Connections are not pinged on checkout; pool_recycle retires them before
+# typical server/network idle timeouts, and disconnects are handled below
+# (ORM/Core queries) and in driver_connection (raw asyncpg queries).
 engine = create_async_engine(
     ASYNC_DATABASE_URL,
-    echo=settings.DEBUG,
+    echo=False,
     future=True,
-    pool_size=5,
-    max_overflow=10,
-    pool_pre_ping=True,
-    pool_recycle=3600,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=30,
+    pool_pre_ping=False,
+    pool_recycle=1800,
+    # Reuse the most recently returned (warm) connection first
+    pool_use_lifo=True,
+    # Raised from the default of 500 so hot statements don't churn the compiled cache
+    query_cache_size=1200,
+    # Per-connection prepared statement caches: asyncpg's own (raw driver queries)
+    # and SQLAlchemy's asyncpg adapter (ORM/Core queries). Set
+    # DB_STATEMENT_CACHE_SIZE=0 behind PgBouncer in transaction pooling mode.
+    connect_args={
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+    },
 )
 
+
+@event.listens_for(engine.sync_engine, "handle_error")
+def _on_disconnect(context: ExceptionContext) -> None:
+    # SQLAlchemy invalidates the whole pool on a disconnect error, so the next
+    # checkout opens a fresh connection instead of reusing a dead one.
+    if context.is_disconnect:
+        logger.warning(f"Database connection lost, invalidating pool: {context.original_exception}")
+
+
 AsyncSessionLocal = async_sessionmaker(
     engine,
     class_=AsyncSession,
@@ -54,16 +101,51 @@ class Base(DeclarativeBase):
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with AsyncSessionLocal() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
+        yield session
+
+
+# Raised by asyncpg when the server side of a connection has gone away
+_DRIVER_DISCONNECT_ERRORS = (asyncpg.InterfaceError, asyncpg.PostgresConnectionError)
+
+
+@asynccontextmanager
+async def driver_connection(db: AsyncSession) -> AsyncIterator[asyncpg.Connection]:
+    """Yield the raw asyncpg connection behind the session's current connection.
+
+    Used by hot read paths to run a single query without the ORM result machinery.
+    Queries run here bypass SQLAlchemy's execution path, so its disconnect
+    handling never sees their failures: a dead connection is invalidated here
+    instead, rather than going back to the pool to fail the next request too.
+    """
+    conn = await db.connection()
+    raw = await conn.get_raw_connection()
+    try:
+        yield raw.driver_connection
+    except _DRIVER_DISCONNECT_ERRORS as e:
+        logger.warning(f"Database connection lost, invalidating it: {e}")
+        await conn.invalidate()
+        raise
+
+
+async def create_probe_pool() -> asyncpg.Pool:
+    """Create a small raw asyncpg pool for health probes, separate from the engine.
+
+    min_size=0 opens no connections up front, so startup doesn't fail while the
+    database is unreachable and an idle probe pool holds nothing open.
+    """
+    return await asyncpg.create_pool(
+        dsn=get_asyncpg_dsn(ASYNC_DATABASE_URL),
+        min_size=0,
+        max_size=2,
+        # Same setting as the engine, so DB_STATEMENT_CACHE_SIZE=0 also keeps
+        # probes working behind PgBouncer in transaction pooling mode
+        statement_cache_size=settings.DB_STATEMENT_CACHE_SIZE,
+    )
 
 
 async def check_db_connection() -> bool:
     try:
-        async with engine.begin() as conn:
-            from sqlalchemy import text
+        async with engine.connect() as conn:
             await conn.execute(text("SELECT 1"))
         return True
     except Exception as e:
@@ -0,0 +1,93 @@
+"""Error handling for the Orbit API: the outer ASGI middleware and validation errors."""
+
+import logging
+import traceback
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_INTERNAL_ERROR_CONTENT: dict[str, str] = {
+    "detail": "Internal server error",
+    "message": "An unexpected error occurred. Please try again later.",
+}
+_INTERNAL_ERROR_BODY = orjson.dumps(_INTERNAL_ERROR_CONTENT)
+
+
+class ErrorMiddleware:
+    """Turn unhandled exceptions into a JSON 500 response.
+
+    Implemented as plain ASGI rather than an exception handler or
+    BaseHTTPMiddleware, so the success path is a single awaited call with no
+    Request/Response objects built around it.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as exc:
+            # Formatting the traceback is the expensive part, so skip it when
+            # error logging is switched off
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error(f"Unhandled exception: {exc}\n{traceback.format_exc()}")
+
+            # Too late to replace the response; let the server abort it
+            if response_started:
+                raise
+
+            body = _INTERNAL_ERROR_BODY
+            if settings.DEBUG:
+                body = orjson.dumps({
+                    **_INTERNAL_ERROR_CONTENT,
+                    "traceback": traceback.format_exc(),
+                })
+
+            await send({
+                "type": "http.response.start",
+                "status": 500,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                ],
+            })
+            await send({"type": "http.response.body", "body": body})
+
+
+async def validation_exception_handler(_request: Request, exc: RequestValidationError) -> Response:
+    """Return request validation errors as a 422 with the full error list.
+
+    FastAPI raises RequestValidationError inside the app and its exception
+    middleware always handles it there, so it never reaches ErrorMiddleware;
+    this handler replaces FastAPI's default one instead of adding a layer.
+    """
+    # The stdlib encoder behind JSONResponse, not orjson: the errors echo the
+    # client's input back, and orjson can't encode integers beyond 64 bits.
+    # Errors from custom validators carry the raised exception in "ctx";
+    # encoding it as str gives its message instead of an empty object.
+    content = jsonable_encoder(
+        {"detail": "Validation error", "errors": exc.errors()},
+        custom_encoder={Exception: str},
+    )
+    return JSONResponse(status_code=422, content=content)
@@ -1,25 +1,88 @@
 """Security utilities for authentication and authorization."""
 
+import asyncio
+import hashlib
+import threading
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict, Any
 
-from fastapi import HTTPException, status
+import bcrypt
+import jwt
+from cachetools import TTLCache
+from fastapi import HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+from jwt.exceptions import PyJWTError
 
 from app.core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
+class BearerTokenScheme(OAuth2PasswordBearer):
+    """OAuth2 bearer scheme that extracts the token with a single prefix check.
 
-def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+    Subclassing keeps the OpenAPI security scheme used by Swagger UI.
+    """
 
+    async def __call__(self, request: Request) -> Optional[str]:
+        authorization = request.headers.get("Authorization")
+        # Auth schemes are case-insensitive (RFC 7235), as in OAuth2PasswordBearer
+        if not authorization or authorization[:7].lower() != "bearer ":
+            if not self.auto_error:
+                return None
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Not authenticated",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        return authorization[7:]
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+
+oauth2_scheme = BearerTokenScheme(tokenUrl="auth/login", scheme_name="OAuth2PasswordBearer")
+
+# Only turned into an HTTPException when actually raising, so the success path
+# of every authenticated request allocates nothing for it.
+CREDENTIALS_EXCEPTION_KWARGS: Dict[str, Any] = {
+    "status_code": status.HTTP_401_UNAUTHORIZED,
+    "detail": "Could not validate credentials",
+    "headers": {"WWW-Authenticate": "Bearer"},
+}
+
+_DEFAULT_EXPIRES_DELTA = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+_ALGORITHMS = [settings.ALGORITHM]
+
+# Verified JWT payloads keyed by a 16-byte blake2b digest of the token, so
+# repeat requests with the same bearer token skip signature verification.
+# Together with the user cache in app.api.deps, a warm request does no crypto
+# and no database work. Entries also carry the token "exp" and are never served
+# past it, even if the cache TTL has not elapsed.
+_JWT_CACHE_TTL_SECONDS = 30
+_jwt_cache: TTLCache[bytes, tuple[Dict[str, Any], float]] = TTLCache(
+    maxsize=10000, ttl=_JWT_CACHE_TTL_SECONDS
+)
+_jwt_cache_lock = threading.Lock()
+
+
+def _hash_password_sync(password: str) -> str:
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
+    return bcrypt.hashpw(password.encode(), salt).decode()
+
+
+def _verify_password_sync(plain_password: str, hashed_password: str) -> bool:
+    return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
+
+
+# bcrypt is CPU-bound, so hashing runs in a worker thread to keep the event loop free.
+async def hash_password(password: str) -> str:
+    return await asyncio.to_thread(_hash_password_sync, password)
+
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return await asyncio.to_thread(_verify_password_sync, plain_password, hashed_password)
+
+
+# Verified against when a login email is unknown, so that path costs the same
+# bcrypt work as a wrong password and response time doesn't reveal which emails exist.
+DUMMY_PASSWORD_HASH = _hash_password_sync("x" * 16)
 
 
 def create_access_token(
@@ -28,12 +91,7 @@ def create_access_token(
 ) -> str:
     to_encode = data.copy()
 
-    if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
-    else:
-        expire = datetime.now(timezone.utc) + timedelta(
-            minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-        )
+    expire = datetime.now(timezone.utc) + (expires_delta or _DEFAULT_EXPIRES_DELTA)
 
     to_encode.update({"exp": expire})
 
@@ -45,23 +103,30 @@ def create_access_token(
 
 
 def decode_access_token(token: str) -> Dict[str, Any]:
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    now = time.time()
+
+    with _jwt_cache_lock:
+        cached = _jwt_cache.get(key)
+    if cached is not None and cached[1] > now:
+        return cached[0]
 
     try:
         payload = jwt.decode(
             token,
             settings.SECRET_KEY,
-            algorithms=[settings.ALGORITHM]
+            algorithms=_ALGORITHMS
         )
 
         if payload is None:
-            raise credentials_exception
+            raise HTTPException(**CREDENTIALS_EXCEPTION_KWARGS)
+
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)) and exp > now:
+            with _jwt_cache_lock:
+                _jwt_cache[key] = (payload, float(exp))
 
         return payload
 
-    except JWTError as e:
-        raise credentials_exception from e
\ No newline at end of file
+    except PyJWTError as e:
+        raise HTTPException(**CREDENTIALS_EXCEPTION_KWARGS) from e
\ No newline at end of file
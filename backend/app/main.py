@@ -1,15 +1,18 @@
+import asyncio
 import logging
+import time
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Depends, Request
+import orjson
+from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import text
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
 
-from app.core.database import get_db, check_db_connection, close_db
+from app.core.database import check_db_connection, close_db, create_probe_pool
 from app.core.config import settings
+from app.core.middleware import ErrorMiddleware, validation_exception_handler
 from app.api.auth import router as auth_router
 from app.api.projects import router as projects_router
 
@@ -17,9 +20,11 @@ logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
-async def lifespan(_app: FastAPI):
+async def lifespan(app: FastAPI):
     logger.info("Starting Orbit API...")
 
+    app.state.pool = await create_probe_pool()
+
     if await check_db_connection():
         logger.info("Database connection successful")
     else:
@@ -27,6 +32,7 @@ async def lifespan(_app: FastAPI):
 
     yield
 
+    await app.state.pool.close()
     await close_db()
     logger.info("Orbit API shut down")
 
@@ -35,6 +41,8 @@ app = FastAPI(
     title="Orbit API",
     description="AI-powered project management API using Claude for intelligent task enhancement",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
+    exception_handlers={RequestValidationError: validation_exception_handler},
     lifespan=lifespan
 )
 
@@ -45,68 +53,78 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
-
-
-@app.exception_handler(Exception)
-async def global_exception_handler(request: Request, exc: Exception):
-    import traceback
-    logger.error(f"Unhandled exception: {exc}\n{traceback.format_exc()}")
-
-    content: dict[str, str] = {
-        "detail": "Internal server error",
-        "message": "An unexpected error occurred. Please try again later.",
-    }
-    if settings.DEBUG:
-        content["traceback"] = traceback.format_exc()
-
-    return JSONResponse(status_code=500, content=content)
-
-
-@app.exception_handler(RequestValidationError)
-async def validation_exception_handler(request: Request, exc: RequestValidationError):
-    return JSONResponse(
-        status_code=422,
-        content={
-            "detail": "Validation error",
-            "errors": exc.errors()
-        }
-    )
+# Compress larger responses (e.g. project lists); small ones like /health are left as-is
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+# Added last so it is outermost and also catches errors from the middleware above
+app.add_middleware(ErrorMiddleware)
 
 
 app.include_router(auth_router)
 app.include_router(projects_router)
 
 
-@app.get("/")
-def read_root():
-    return {
+# Both responses only depend on settings, so they are built once at import and
+# served from plain Starlette routes: no dependency solving, parameter parsing
+# or response-model serialization for endpoints that probes hit constantly.
+_ROOT_RESPONSE = Response(
+    orjson.dumps({
         "message": "Welcome to Orbit API",
         "version": settings.APP_VERSION,
         "docs": "/docs"
-    }
-
-
-@app.get("/health")
-def health_check():
-    return {
+    }),
+    media_type="application/json",
+)
+_HEALTH_RESPONSE = Response(
+    orjson.dumps({
         "status": "healthy",
         "version": settings.APP_VERSION,
         "service": settings.APP_NAME
-    }
+    }),
+    media_type="application/json",
+)
+
+
+async def read_root(_request: Request) -> Response:
+    return _ROOT_RESPONSE
+
+
+async def health_check(_request: Request) -> Response:
+    return _HEALTH_RESPONSE
+
+
+app.add_route("/", read_root, methods=["GET"])
+app.add_route("/health", health_check, methods=["GET"])
+
+
+# A successful DB probe is reused for a few seconds, which is shorter than typical
+# probe intervals, and concurrent probes wait on one in-flight query.
+_DB_HEALTH_TTL_SECONDS = 5.0
+_db_health: dict[str, float] = {"checked_at": float("-inf")}
+_db_health_lock = asyncio.Lock()
+
+
+def _db_health_is_fresh() -> bool:
+    return time.monotonic() - _db_health["checked_at"] < _DB_HEALTH_TTL_SECONDS
 
 
 @app.get("/health/db")
-async def database_health_check(db: AsyncSession = Depends(get_db)):
-    try:
-        result = await db.execute(text("SELECT 1"))
-        result.scalar()
-        return {
-            "status": "healthy",
-            "database": "connected",
-        }
-    except Exception as e:
-        return {
-            "status": "unhealthy",
-            "database": "disconnected",
-            "error": str(e)
-        }
+async def database_health_check(request: Request):
+    if not _db_health_is_fresh():
+        async with _db_health_lock:
+            if not _db_health_is_fresh():
+                try:
+                    # Raw asyncpg: no session, transaction or result wrapping for a probe
+                    async with request.app.state.pool.acquire() as conn:
+                        await conn.fetchval("SELECT 1")
+                except Exception as e:
+                    return {
+                        "status": "unhealthy",
+                        "database": "disconnected",
+                        "error": str(e)
+                    }
+                _db_health["checked_at"] = time.monotonic()
+
+    return {
+        "status": "healthy",
+        "database": "connected",
+    }
@@ -3,7 +3,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import String, ForeignKey
+from sqlalchemy import DateTime, ForeignKey, Index, String, Uuid, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -13,15 +13,15 @@ class Project(Base):
     __tablename__ = "projects"
 
     id: Mapped[uuid.UUID] = mapped_column(
+        Uuid(as_uuid=True),
         primary_key=True,
         default=uuid.uuid4,
-        index=True,
     )
 
     user_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
 
     name: Mapped[str] = mapped_column(
@@ -46,14 +46,17 @@ class Project(Base):
         nullable=True,
     )
 
+    # Timestamps are filled in by PostgreSQL (TIMESTAMP WITH TIME ZONE), not Python
     created_at: Mapped[datetime] = mapped_column(
-        default=datetime.utcnow,
+        DateTime(timezone=True),
+        server_default=func.now(),
         nullable=False,
     )
 
     updated_at: Mapped[datetime] = mapped_column(
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False,
     )
 
@@ -61,3 +64,16 @@ class Project(Base):
 
     def __repr__(self) -> str:
         return f"<Project(id={self.id}, name='{self.name}', user_id={self.user_id})>"
+
+
+# Matches the list_projects ordering, so a user's page (and the keyset cursor
+# condition) is read straight off the index without a sort. INCLUDE carries the
+# short list columns; description is left out to keep index entries small.
+# Also serves plain user_id lookups, such as the ON DELETE CASCADE from users.
+Index(
+    "ix_projects_user_created",
+    Project.user_id,
+    Project.created_at.desc(),
+    Project.id.desc(),
+    postgresql_include=["name", "status", "color"],
+)
@@ -3,7 +3,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import String
+from sqlalchemy import DateTime, String, Uuid, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -13,9 +13,9 @@ class User(Base):
     __tablename__ = "users"
 
     id: Mapped[uuid.UUID] = mapped_column(
+        Uuid(as_uuid=True),
         primary_key=True,
         default=uuid.uuid4,
-        index=True,
     )
 
     email: Mapped[str] = mapped_column(
@@ -35,15 +35,17 @@ class User(Base):
         nullable=True,
     )
 
-    # Using utcnow() for timezone-naive datetimes matching TIMESTAMP WITHOUT TIME ZONE columns
+    # Timestamps are filled in by PostgreSQL (TIMESTAMP WITH TIME ZONE), not Python
     created_at: Mapped[datetime] = mapped_column(
-        default=datetime.utcnow,
+        DateTime(timezone=True),
+        server_default=func.now(),
         nullable=False,
     )
 
     updated_at: Mapped[datetime] = mapped_column(
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False,
     )
 
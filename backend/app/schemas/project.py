@@ -2,36 +2,41 @@
 
 import uuid
 from datetime import datetime
-from typing import Literal, Optional
+from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 ProjectStatus = Literal["active", "archived", "completed"]
 
 
 class ProjectCreate(BaseModel):
     name: str = Field(..., min_length=1, max_length=255, examples=["My Project"])
-    description: Optional[str] = Field(None, max_length=1000)
+    description: str | None = Field(None, max_length=1000)
     status: ProjectStatus = "active"
-    color: Optional[str] = Field(None, max_length=7, examples=["#3B82F6"])
+    color: str | None = Field(None, max_length=7, examples=["#3B82F6"])
 
 
 class ProjectUpdate(BaseModel):
-    name: Optional[str] = Field(None, min_length=1, max_length=255)
-    description: Optional[str] = Field(None, max_length=1000)
-    status: Optional[ProjectStatus] = None
-    color: Optional[str] = Field(None, max_length=7)
+    name: str | None = Field(None, min_length=1, max_length=255)
+    description: str | None = Field(None, max_length=1000)
+    status: ProjectStatus | None = None
+    color: str | None = Field(None, max_length=7)
 
 
 class ProjectResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: uuid.UUID
     user_id: uuid.UUID
     name: str
-    description: Optional[str]
+    description: str | None
     status: str
-    color: Optional[str]
+    color: str | None
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+
+class ProjectPage(BaseModel):
+    items: list[ProjectResponse]
+    # Opaque token; pass back as ?cursor= to fetch the next page. None on the last page
+    next_cursor: str | None = None
@@ -1,43 +1,103 @@
 """User Pydantic schemas for API request/response validation."""
 
-import re
+import string
 import uuid
 from datetime import datetime
-from typing import Optional
+from typing import Annotated, Literal
 
-from pydantic import BaseModel, EmailStr, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, field_validator
+
+# Deliberately a pragmatic subset of RFC 5321 rather than EmailStr, which runs
+# email-validator's full syntax and IDNA checks on every request. The pattern is
+# compiled once by pydantic-core (Rust regex, linear time).
+_EMAIL_PATTERN = r"^[A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,}$"
+
+_SPECIALS = '!@#$%^&*(),.?":{}|<>'
+
+# Class tags for the password complexity rules
+_UPPER, _LOWER, _DIGIT, _SPECIAL = b"ULDS"
+
+
+def _build_class_table() -> bytes:
+    table = bytearray(256)  # anything unclassified maps to 0
+    for chars, tag in (
+        (string.ascii_uppercase, _UPPER),
+        (string.ascii_lowercase, _LOWER),
+        (string.digits, _DIGIT),
+        (_SPECIALS, _SPECIAL),
+    ):
+        for ch in chars:
+            table[ord(ch)] = tag
+    return bytes(table)
+
+
+# Every class the rules check for is ASCII, so the password is classified as
+# bytes: one C-level bytes.translate over a 256-entry table, one byte per char.
+_CLASS_TABLE = _build_class_table()
+
+
+def _password_issue(password: str) -> str | None:
+    """Return the first complexity rule the password fails, or None if it passes.
+
+    Not memoized: a result cache would keep plaintext passwords in memory.
+    """
+    # Non-ASCII characters can't satisfy the ASCII-only classes, so dropping
+    # them loses nothing (ASCII input takes the plain fast encode path)
+    tags = set(password.encode("ascii", "ignore").translate(_CLASS_TABLE))
+
+    if _UPPER not in tags:
+        return "Password must contain at least 1 uppercase letter"
+    if _LOWER not in tags:
+        return "Password must contain at least 1 lowercase letter"
+    # \d also accepts non-ASCII decimal digits; isascii() skips that scan for ASCII input
+    if _DIGIT not in tags and (
+        password.isascii() or not any(ch.isdecimal() for ch in password)
+    ):
+        return "Password must contain at least 1 number"
+    if _SPECIAL not in tags:
+        return "Password must contain at least 1 special character"
+    return None
 
 
 class UserCreate(BaseModel):
-    email: EmailStr = Field(..., examples=["john@example.com"])
-    password: str = Field(..., min_length=8, max_length=100, examples=["SecurePass123!"])
-    full_name: Optional[str] = Field(None, min_length=1, max_length=255, examples=["John Doe"])
+    email: str = Field(..., pattern=_EMAIL_PATTERN, max_length=254, examples=["john@example.com"])
+    # Strict str with the length bounds checked in pydantic-core, before
+    # password_complexity (an after-validator) is ever called
+    password: Annotated[str, StringConstraints(min_length=8, max_length=100, strict=True)] = Field(
+        ..., examples=["SecurePass123!"]
+    )
+    full_name: str | None = Field(None, min_length=1, max_length=255, examples=["John Doe"])
+
+    @field_validator("email")
+    @classmethod
+    def normalize_email_domain(cls, v: str) -> str:
+        # Domains are case-insensitive; lowercase them as EmailStr did so the
+        # same address can't be registered twice with different casing
+        local, _, domain = v.rpartition("@")
+        return f"{local}@{domain.lower()}"
 
-    @field_validator("password")
+    @field_validator("password", mode="after")
     @classmethod
     def password_complexity(cls, v: str) -> str:
-        if not re.search(r"[A-Z]", v):
-            raise ValueError("Password must contain at least 1 uppercase letter")
-        if not re.search(r"[a-z]", v):
-            raise ValueError("Password must contain at least 1 lowercase letter")
-        if not re.search(r"\d", v):
-            raise ValueError("Password must contain at least 1 number")
-        if not re.search(r'[!@#$%^&*(),.?":{}|<>]', v):
-            raise ValueError("Password must contain at least 1 special character")
+        issue = _password_issue(v)
+        if issue is not None:
+            raise ValueError(issue)
         return v
 
 
 class UserResponse(BaseModel):
-    id: uuid.UUID
+    model_config = ConfigDict(from_attributes=True)
+
+    # Always a UUID object from the database, so skip the lax string parsing path
+    id: Annotated[uuid.UUID, Field(strict=True)]
     email: str
-    full_name: Optional[str]
+    full_name: str | None
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class Token(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     access_token: str
-    token_type: str = "bearer"
+    token_type: Literal["bearer"] = "bearer"